@@ -3,9 +3,11 @@
 # board state + rule mechanics (pure logic)
 
 from __future__ import annotations # This is needed for Python 3.7 and 3.8 compatibility
-from typing import List, Tuple, Dict 
+from typing import List, Tuple, Dict, Iterator, Optional, ClassVar, Callable, NamedTuple, Union
+from functools import lru_cache
 
 from .utils import in_bounds, to_algebra, from_algebra, BOARD_SIZE
+from . import search_jit
 
 WHITE = 1
 BLACK = -1
@@ -16,6 +18,120 @@ DIRECTIONS = [(-1, -1), (-1, 0), (-1, 1),       # Valid directions for move chec
               (0, -1),          (0, 1),
               (1, -1),  (1, 0),  (1, 1)]
 
+# ---- bitboard constants ----
+FULL = (1 << (BOARD_SIZE * BOARD_SIZE)) - 1 # every square set
+NOT_A = 0xfefefefefefefefe # every square except column a (kills wraparound when shifting east)
+NOT_H = 0x7f7f7f7f7f7f7f7f # every square except column h (kills wraparound when shifting west)
+# mask to apply after shifting one step in each direction
+_SHIFT_MASKS = {d: FULL & (NOT_A if d[1] == 1 else NOT_H if d[1] == -1 else FULL) for d in DIRECTIONS}
+COLUMN_HEADER = "  " + " ".join(chr(ord('a') + i) for i in range(BOARD_SIZE)) # Column labels a-h for to_string (referenced in worklog)
+# starting position: d4/e5 white, e4/d5 black (bit r * 8 + c with mid = 4)
+_MID = BOARD_SIZE // 2
+INITIAL_WHITE = (1 << ((_MID - 1) * BOARD_SIZE + _MID - 1)) | (1 << (_MID * BOARD_SIZE + _MID))
+INITIAL_BLACK = (1 << ((_MID - 1) * BOARD_SIZE + _MID)) | (1 << (_MID * BOARD_SIZE + _MID - 1))
+# single-bit -> (row, col) lookup used when turning a bitboard back into a move list
+BIT_TO_RC = {1 << (r * BOARD_SIZE + c): (r, c) for r in range(BOARD_SIZE) for c in range(BOARD_SIZE)}
+
+def _ray(row: int, col: int, drow: int, dcol: int) -> Tuple[int, ...]:
+    """Bits of the squares walked from (row, col) in direction (drow, dcol), nearest first, stopping at the edge."""
+    bits = []
+    rr, cc = row + drow, col + dcol
+    while in_bounds(rr, cc):
+        bits.append(1 << (rr * BOARD_SIZE + cc))
+        rr += drow
+        cc += dcol
+    return tuple(bits)
+
+# RAYS[r * 8 + c] = the rays leaving square (r, c), precomputed once so _flips_bb_py needs no shifting or bounds checks.
+# Rays shorter than 2 squares are dropped: flipping needs at least one opponent disc plus one of ours behind it.
+RAYS = [tuple(ray for ray in (_ray(r, c, dr, dc) for dr, dc in DIRECTIONS) if len(ray) >= 2)
+        for r in range(BOARD_SIZE) for c in range(BOARD_SIZE)]
+
+def shift(b: int, d: Tuple[int, int]) -> int:
+    """Move every bit of `b` one square in direction d = (drow, dcol); bits that leave the board are dropped."""
+    amount = d[0] * BOARD_SIZE + d[1]
+    b = (b << amount) if amount > 0 else (b >> -amount)
+    return b & _SHIFT_MASKS[d]
+
+def _legal_moves_loop(own: int, opp: int) -> int:
+    """
+    Bitboard of every legal move for the side owning `own` (dumb7fill).
+    For each direction, flood out from our discs through runs of opponent discs;
+    an empty square right behind such a run is a legal move. All 64 squares are handled at once.
+    Reference version: legal_moves_bb runs the same fill, unrolled (see _unrolled_source).
+    """
+    empty = ~(own | opp) & FULL
+    moves = 0
+    for d in DIRECTIONS:
+        t = opp & shift(own, d)
+        for _ in range(5): # a run of opponent discs is at most 6 long
+            t |= opp & shift(t, d)
+        moves |= empty & shift(t, d)
+    return moves
+
+def _unrolled_source() -> str:
+    """
+    Source of `legal_moves_unrolled`: _legal_moves_loop with both loops unrolled and every shift amount
+    and mask written in as a literal, so the 8 directions run as straight-line code (no shift() calls).
+    """
+    lines = ["def legal_moves_unrolled(own, opp):",
+             f"    empty = ~(own | opp) & {FULL:#x}",
+             "    moves = 0"]
+    for d in DIRECTIONS:
+        amount = d[0] * BOARD_SIZE + d[1]
+        step = f"(({{}} << {amount}) & {_SHIFT_MASKS[d]:#x})" if amount > 0 else f"(({{}} >> {-amount}) & {_SHIFT_MASKS[d]:#x})"
+        lines.append(f"    t = opp & {step.format('own')}")
+        lines += [f"    t |= opp & {step.format('t')}"] * 5
+        lines.append(f"    moves |= empty & {step.format('t')}")
+    lines.append("    return moves")
+    return "\n".join(lines)
+
+_generated: Dict[str, Callable[[int, int], int]] = {}
+exec(_unrolled_source(), _generated) # built once at import time
+legal_moves_unrolled = _generated["legal_moves_unrolled"]
+
+# positions repeat a lot inside the search tree, so memoize on (own, opp)
+legal_moves_bb = lru_cache(maxsize=1 << 16)(legal_moves_unrolled)
+
+def _flips_bb_py(own: int, opp: int, move: int) -> int:
+    """Pure-Python ray walk: bitboard of opponent discs flipped when the side owning `own` plays the single bit `move` (0 if none)."""
+    flipped = 0
+    for ray in RAYS[move.bit_length() - 1]:
+        line = 0
+        for b in ray: # walk the ray through opponent discs
+            if opp & b:
+                line |= b
+            else:
+                if own & b: # ray closed by one of our discs -> the whole line flips
+                    flipped |= line
+                break
+    return flipped
+
+flips_bb = _flips_bb_py
+
+if search_jit.NUMBA_AVAILABLE:
+    # Numba is installed: swap in the compiled kernels (same signatures and results), keeping the memoization
+    legal_moves_bb = lru_cache(maxsize=1 << 16)(search_jit.legal_moves_bb)
+    flips_bb = search_jit.flips_bb
+
+@lru_cache(maxsize=1 << 16)
+def legal_moves_flips_bb(own: int, opp: int) -> Tuple[Tuple[int, int], ...]:
+    """Every legal move for `own` as (move bit, flipped-discs bitboard) pairs, so callers never redo the ray walk."""
+    moves = legal_moves_bb(own, opp)
+    pairs = []
+    while moves:
+        move = moves & -moves
+        pairs.append((move, flips_bb(own, opp, move)))
+        moves ^= move
+    return tuple(pairs)
+
+def iter_bits(b: int) -> Iterator[Tuple[int, int]]:
+    """Yield (row, col) for every set bit of `b`, lowest bit (a1) first."""
+    while b:
+        lsb = b & -b # isolate the lowest set bit
+        yield BIT_TO_RC[lsb]
+        b ^= lsb
+
 # @param color: int - color of the player
 
 def opponent(color: int) -> int: 
@@ -28,61 +144,111 @@ def opponent(color: int) -> int:
     """
     return -color
 
+class Score(NamedTuple):
+    """Disc count per color, as returned by Board.score()."""
+    white: int
+    black: int
+
+    def __getitem__(self, key: Union[int, str]) -> int: # type: ignore[override]
+        # also accept the old dict keys, so score["white"] keeps working
+        if isinstance(key, str):
+            if key not in self._fields:
+                raise KeyError(key)
+            return getattr(self, key)
+        return tuple.__getitem__(self, key)
+
 class Board:
-    size = BOARD_SIZE # Standard Othello board size
+    size: ClassVar[int] = BOARD_SIZE # Standard Othello board size
     def __init__(self) -> None:
-        self.grid: List[List[int]] = [[EMPTY for _ in range(self.size)] for _ in range(self.size)] # 8x8 board initialized to EMPTY
+        # Two 64-bit bitboards: bit (r * size + c) is set when that color owns square (r, c)
+        self.white: int = 0
+        self.black: int = 0
         
     @staticmethod
     def initial() -> Board:
+        # Set up the initial four pieces in the center (precomputed bitboards)
+        return Board.from_bitboards(INITIAL_WHITE, INITIAL_BLACK)
+
+    @staticmethod
+    def from_bitboards(white: int, black: int) -> Board:
+        """Build a position in one step from its two bitboards (bit r * size + c set = that color owns (r, c))."""
+        if white & black:
+            raise ValueError("Invalid bitboards: a square cannot be both white and black.")
+        if (white | black) & ~FULL:
+            raise ValueError("Invalid bitboards: only bits 0-63 (squares a1-h8) may be set.")
         board = Board()
-        mid = Board.size // 2
-        # Set up the initial four pieces in the center
-        board.grid[mid - 1][mid - 1] = WHITE
-        board.grid[mid][mid] = WHITE
-        board.grid[mid - 1][mid] = BLACK
-        board.grid[mid][mid - 1] = BLACK
-
-        # Set rest of the board to EMPTY
-        for r in range(board.size):
-            for c in range(board.size):
-                if (r, c) not in [(mid - 1, mid - 1), (mid, mid), (mid - 1, mid), (mid, mid - 1)]:
-                    board.grid[r][c] = EMPTY
+        board.white = white
+        board.black = black
         return board
     
     def copy(self) -> Board:
         new_board = Board()
-        new_board.grid = [row[:] for row in self.grid] # ':' is the slice operator to copy lists in 1 dimension
+        new_board.white = self.white # ints are immutable, so no deep copy is needed
+        new_board.black = self.black
         return new_board
 
+    def cells(self) -> List[int]:
+        """Flat decoded view of the board: cell r * size + c is WHITE / BLACK / EMPTY. One pass over each bitboard."""
+        flat = [EMPTY] * (self.size * self.size)
+        for color, b in ((WHITE, self.white), (BLACK, self.black)):
+            while b:
+                lsb = b & -b
+                flat[lsb.bit_length() - 1] = color
+                b ^= lsb
+        return flat
+
+    def __eq__(self, other: object) -> bool:
+        """Two boards are equal when they hold the same position (two int compares)."""
+        if not isinstance(other, Board):
+            return NotImplemented
+        return self.white == other.white and self.black == other.black
+
+    def __hash__(self) -> int:
+        # hashes the current position: don't mutate a Board while it is used as a dict key or set member
+        return hash((self.white, self.black))
+
+    @property
+    def grid(self) -> List[List[int]]:
+        """Decoded 8x8 view of the board (WHITE / BLACK / EMPTY per cell). Rebuilt on every access."""
+        flat = self.cells()
+        return [flat[r * self.size:(r + 1) * self.size] for r in range(self.size)]
+
     def get(self, row: int, col: int) -> int:
         """Return the piece at the specified row and column."""
-        return self.grid[row][col]
+        bit = 1 << (row * self.size + col)
+        if self.white & bit:
+            return WHITE
+        if self.black & bit:
+            return BLACK
+        return EMPTY
     def set(self, row: int, col: int, color: int) -> None:
         """Set the piece at the specified row and column to the given color."""
-        self.grid[row][col] = color
+        bit = 1 << (row * self.size + col)
+        self.white &= ~bit # clear the square on both boards first
+        self.black &= ~bit
+        if color == WHITE:
+            self.white |= bit
+        elif color == BLACK:
+            self.black |= bit
         
         # sync accidental duplicate method
     def in_bounds(self, row: int, col: int) -> bool:
         return in_bounds(row, col, self.size)
     
-    def score(self) -> Dict[str, int]:
+    def score(self) -> Score:
         """Count the number of pieces for each color on the board"""
-        w = sum(cell == WHITE for row in self.grid for cell in row) # shorthand for loop through rows then columns and += 1 if cell matches WHITE
-        b = sum(cell == BLACK for row in self.grid for cell in row) # shorthand for loop through rows then columns and += 1 if cell matches BLACK
-        return {"white": w, "black": b}
+        return Score(self.white.bit_count(), self.black.bit_count()) # popcount of each bitboard
 
     def to_string(self, symbols: Dict[int, str] = SYMBOLS) -> str:
         """
         Coordinate-based string representation of the board.
         Ex: d4 -> column d(3), row 4(3)
         """
-        cols = f"  " + " ".join([chr(ord('a') + i) for i in range(self.size)]) # Column labels a-h (referenced in worklog)
-        lines = [cols] # Start with column headers
+        lines = [COLUMN_HEADER] # Start with column headers
+        cells = list(map(symbols.__getitem__, self.cells())) # bits are only decoded here, when rendering; one lookup per cell
         for r in range(self.size):
-            row_syms = " ".join(symbols[self.grid[r][c]] for c in range(self.size))
             # Add row number and row symbols
-            lines.append(f"{r + 1} {row_syms}")
+            lines.append(f"{r + 1} " + " ".join(cells[r * self.size:(r + 1) * self.size]))
         return "\n".join(lines)
     
 
@@ -94,37 +260,41 @@ class Board:
             col (int): The column index where the piece is placed.
             color (int): The color of the piece being placed (WHITE or BLACK).
         """
-        if not self.in_bounds(row, col) or self.get(row, col) != EMPTY:
-            return [] # Out of bounds or not empty
-        flips_list: List[Tuple[int, int]] = [] # To store all pieces to flip
+        if not (0 <= row < 8 and 0 <= col < 8): # bounds check inlined (no in_bounds() call on the hot path)
+            return [] # Out of bounds
+        own, opp = (self.white, self.black) if color == WHITE else (self.black, self.white)
+        move = 1 << (row * 8 + col)
+        if (own | opp) & move:
+            return [] # Not empty
+        return list(iter_bits(flips_bb(own, opp, move)))
 
-        # Loop through all directions and check if there are any opponent pieces in the line
-        
-        for drow, dcol in DIRECTIONS: # Check valid directions list
-            rr, cc = row + drow, col + dcol # Step in the direction (rr = row row delta, cc = col col delta)
-            line: List[Tuple[int, int]] = [] # To store potential flips in this direction
-            while self.in_bounds(rr, cc) and self.get(rr, cc) == opponent(color): # While in bounds and opponent's piece
-                line.append((rr, cc)) # Potential flip
-                rr += drow
-                cc += dcol
-            # Check if we ended on a piece of the current player's color by following the direction until we hit a different color or go out of bounds
-            if self.in_bounds(rr, cc) and self.get(rr, cc) == color: # if we found a piece of the current player's color
-                flips_list.extend(line) # Valid direction, add to flips (extend to add multiple items)
-        return flips_list # Return all pieces to flip
 
+    def legal_moves_mask(self, color: int) -> int:
+        """Bitboard of every legal move for the given color (memoized on the position by legal_moves_bb)."""
+        if color == WHITE:
+            return legal_moves_bb(self.white, self.black)
+        return legal_moves_bb(self.black, self.white)
 
     def legal_moves(self, color: int) -> List[Tuple[int, int]]:
         """
-        loop through all board positions and return a list of valid moves for the given color.
+        Generate every legal move for the given color at once from the bitboards.
         Returns:
             List[Tuple[int, int]]: A list of (row, col) tuples representing valid moves.
         """
-        moves: List[Tuple[int, int]] = []
-        for r in range(self.size):
-            for c in range(self.size):
-                if self.get(r, c) == EMPTY and self.flips(r, c, color): # If empty and has flips
-                    moves.append((r, c))
-        return moves
+        return list(iter_bits(self.legal_moves_mask(color)))
+
+    def legal_moves_flips(self, color: int) -> List[Tuple[Tuple[int, int], int]]:
+        """
+        Every legal move for the given color together with the bitboard of discs it flips,
+        computed once during move generation so make_move / apply_move_unchecked can skip the ray walk.
+        Returns:
+            List[Tuple[Tuple[int, int], int]]: ((row, col), flips bitboard) pairs.
+        """
+        if color == WHITE:
+            pairs = legal_moves_flips_bb(self.white, self.black)
+        else:
+            pairs = legal_moves_flips_bb(self.black, self.white)
+        return [(BIT_TO_RC[move], flips) for move, flips in pairs]
     
             
     
@@ -136,17 +306,51 @@ class Board:
             col (int): The column index where the piece is placed.
             color (int): The color of the piece being placed (WHITE or BLACK).
         """
-        flips = self.flips(row, col, color)
-        if not flips:
+        own, opp = (self.white, self.black) if color == WHITE else (self.black, self.white)
+        move = 1 << (row * 8 + col) if 0 <= row < 8 and 0 <= col < 8 else 0 # bounds check inlined
+        flipped = flips_bb(own, opp, move) if move and not (own | opp) & move else 0
+        if not flipped:
             raise ValueError("Invalid move: no pieces to flip.")
-        self.set(row, col, color) # Place the piece
-        for fr, fc in flips: # fr is flip row, fc is flip col
-            self.set(fr, fc, color) # Flip the pieces to the current color
+        self.apply_move_unchecked(row, col, color, flipped)
+
+    def apply_move_unchecked(self, row: int, col: int, color: int, flips: int) -> None:
+        """
+        Apply a move that is already known to be legal, skipping validation and the flip computation.
+        Args:
+            row (int): The row index where the piece is placed.
+            col (int): The column index where the piece is placed.
+            color (int): The color of the piece being placed (WHITE or BLACK).
+            flips (int): Bitboard of the discs this move flips (see legal_moves_flips).
+        """
+        move = 1 << (row * 8 + col)
+        if color == WHITE:
+            self.white |= move | flips # place the piece and take over the flipped discs
+            self.black ^= flips
+        else:
+            self.black |= move | flips
+            self.white ^= flips
+    
+    def make_move(self, row: int, col: int, color: int, flips: Optional[int] = None) -> Tuple[int, int]:
+        """
+        Apply a move in place (same rules as apply_move) and return an undo token for unmake_move().
+        Lets the search walk the tree on one Board instead of allocating a copy per node.
+        If the move's flips bitboard is passed (from legal_moves_flips) the move is trusted and applied unchecked.
+        """
+        token = (self.white, self.black) # the previous bitboards are all we need to undo
+        if flips is None:
+            self.apply_move(row, col, color)
+        else:
+            self.apply_move_unchecked(row, col, color, flips)
+        return token
+
+    def unmake_move(self, token: Tuple[int, int]) -> None:
+        """Undo a make_move() by restoring the bitboards it saved."""
+        self.white, self.black = token
     
     def hasMoves(self, color: int) -> bool:
         """ Check if there are any valid moves for the given color. """
-        return any(self.legal_moves(color)) # any returns True if any element of the iterable is true
+        return self.legal_moves_mask(color) != 0
     
     def is_end(self) -> bool:
         """ Check if the game has ended (no valid moves for either player). """
-        return not self.hasMoves(WHITE) and not self.hasMoves(BLACK)
\ No newline at end of file
+        return self.legal_moves_mask(WHITE) == 0 and self.legal_moves_mask(BLACK) == 0
\ No newline at end of file
@@ -8,6 +8,9 @@ from typing import Tuple, Optional
 
 from .log import dprint
 from .board import Board
+from .utils import ALGEBRA_TO_RC
+
+SCORE_LINE = "\nScore  ● (white): %d   ○ (black): %d" # filled with board.score(), which is (white, black)
 
 def clear_screen() -> None:
     """Clears the terminal screen."""
@@ -20,29 +23,11 @@ def parse_move(token: str) -> Optional[Tuple[int, int]]:
     Letter = column (a-h), Number = row (1-8).
     Returns (row_idx, col_idx) zero-based, or None if invalid.
     """
-    token = token.strip().lower() # Normalize input
-    if len(token) < 2 or len(token) > 3:
-        return None
-    col_ch = token[0] # First character is column
-    if not ('a' <= col_ch <= 'h'):
-        return None
-    try:
-        row_num = int(token[1:]) # Remaining characters are row
-    
-    # Handle invalid integer conversion
-    except ValueError:
-        return None
-    if not (1 <= row_num <= 8):
-        return None
-
-    row_idx = row_num - 1
-    col_idx = ord(col_ch) - ord('a')
-    return (row_idx, col_idx)
+    return ALGEBRA_TO_RC.get(token.strip().lower()) # Normalize input, then one lookup (None if not a square)
 
 
 def display_board(board: Board) -> None:
     """Renders the board to the terminal using ASCII characters."""
     clear_screen()
     dprint(board.to_string())
-    s = board.score()
-    dprint(f"\nScore  ● (white): {s['white']}   ○ (black): {s['black']}")
\ No newline at end of file
+    dprint(SCORE_LINE % tuple(board.score()))
\ No newline at end of file
@@ -3,10 +3,19 @@
 # evaluation functions and weight schedules
 # Heuristics are based on info from: (https://www.othello.nl/content/guides/comteguide/strategy.html)
 from __future__ import annotations
-from typing import Dict, Tuple
+from typing import Dict, Tuple, Sequence, Mapping, Optional
+from types import MappingProxyType, ModuleType
 from math import copysign
 
-from .board import Board, WHITE, BLACK, EMPTY
+from .board import Board, WHITE, BLACK, EMPTY, FULL, NOT_A, NOT_H
+
+np: Optional[ModuleType]
+try:
+    import numpy as np
+    NUMPY_AVAILABLE = True
+except ImportError: # numpy is optional; evaluate_batch() is only used when it is installed
+    np = None
+    NUMPY_AVAILABLE = False
 
 # Constants
 CORNERS = [(0,0), (0,7), (7,0), (7,7)] # Board corner positions
@@ -14,6 +23,18 @@ X_SQUARES = [(1,1), (1,6), (6,1), (6,6)] # The diagonal squares next to corners
 # map each X-square to its corner
 _X_TO_CORNER = {(1,1):(0,0), (1,6):(0,7), (6,1):(7,0), (6,6):(7,7)}
 
+# Bitboard versions of the above (bit r*8+c is square (r, c), same layout as Board)
+def _bit(square: Tuple[int, int]) -> int:
+    return 1 << (square[0] * 8 + square[1])
+CORNER_MASK = sum(_bit(sq) for sq in CORNERS)   # 0x8100000000000081
+X_MASK = sum(_bit(sq) for sq in X_SQUARES)      # 0x0042000000004200
+_X_CORNER_BITS = tuple((_bit(x), _bit(corner)) for x, corner in _X_TO_CORNER.items()) # (x-square bit, its corner bit)
+# corners owned (own & CORNER_MASK, 16 possibilities) -> X-squares whose corner is NOT owned, i.e. the penalized ones
+_X_UNGUARDED = {
+    owned: sum(x for x, corner in _X_CORNER_BITS if not owned & corner)
+    for owned in (sum(c for i, (_, c) in enumerate(_X_CORNER_BITS) if n >> i & 1) for n in range(16))
+}
+
 # ======= Public evaluation function =======
 def evaluate(board: Board, color: int):
     """ Return a weighted sum of heuristics for the given board and player color. (+ is good for `color`, - is bad) """
@@ -22,17 +43,12 @@ def evaluate(board: Board, color: int):
     
     # Magnify win states
     if board.is_end(): # if game is over
-        w = sum(1 for r in range(board.size) for c in range(board.size) if board.get(r, c) == WHITE) # count white pieces
-        b = sum(1 for r in range(board.size) for c in range(board.size) if board.get(r, c) == BLACK) # count black pieces
-        diff = (w - b) if color == WHITE else (b - w) # compute difference
+        diff = (board.white.bit_count() - board.black.bit_count()) * color # white - black, flipped for BLACK (-1)
         # magnify so wins outrank any non-terminal eval
         return 1000 * diff
     
-    # Compute individual heuristics
-    disc_diff = disc_difference(board, color)
-    mob = mobility(board, color)
-    corners = corner_control(board, color)
-    x_sq = x_square(board, color)
+    # Compute individual heuristics (all four in one pass over the bitboards)
+    disc_diff, mob, corners, x_sq = _features(board, color)
     # stable_disks = stable_disks(board, color)  # Skipping for now
 
     # Weighted sum
@@ -54,36 +70,22 @@ def disc_difference(board: Board, color: int) -> int:
         board(Board): Current board state (player position)
         color(int): Color of current player 
     """
-    my_cnt = sum(1 for r in range(board.size) for c in range(board.size) if board.get(r,c) == color) #loop through rows then columns; sum all disks that are player color
-    opp_cnt = sum(1 for r in range(board.size) for c in range(board.size) if board.get(r,c) == -color) #loop through rows then columns; sum all disks that are opponent color
-    return my_cnt - opp_cnt
+    return _disc_diff(*_sides(board, color))
 
 # 2.) Mobility Heuristic
 def mobility(board: Board, color: int) -> int:
-    my_moves = len(board.legal_moves(color))
-    opp_moves = len(board.legal_moves(-color))
+    # popcount the legal-move bitboards; is_end() in evaluate() already asked for the same two (cached)
+    my_moves = board.legal_moves_mask(color).bit_count()
+    opp_moves = board.legal_moves_mask(-color).bit_count()
     return my_moves - opp_moves
 
 # 3.) Corner Control Heuristic
 def corner_control(board: Board, color: int) -> int:
-    my_corners = sum(1 for (r,c) in CORNERS if board.get(r,c) == color)
-    opp_corners = sum(1 for (r,c) in CORNERS if board.get(r,c) == -color)
-    return my_corners - opp_corners
+    return _corner_diff(*_sides(board, color))
 
 # 4.) X-Square Penalty Heuristic
 def x_square(board: Board, color: int) -> int:
-    my_sq = 0
-    op_sq = 0
-    for xr, xc in X_SQUARES:
-        cr, cc = _X_TO_CORNER[(xr, xc)] # get corresponding corner
-        corner_owner = board.get(cr, cc)
-        x_owner = board.get(xr, xc)
-        # penalize if corresponding corner is not same color
-        if x_owner == color and corner_owner != color:
-            my_sq += 1
-        elif x_owner == -color and corner_owner != -color:
-            op_sq += 1
-    return my_sq - op_sq  # penalty for owning x-square (will be negative when calling evaluate() function)
+    return _x_penalty(*_sides(board, color)) # penalty for owning x-square (will be negative when calling evaluate() function)
 # 5.) Stable Disks Heuristic
 
     # Too complex for now; skipping implementation
@@ -92,41 +94,140 @@ def x_square(board: Board, color: int) -> int:
 
 
 # --------------------------------- HELPER FUNCTIONS ---------------------------------
+# Per-side helpers: the heuristic formulas on (own, opp) bitboards, shared by the heuristics above and _features()
+def _sides(board: Board, color: int) -> Tuple[int, int]:
+    """(own, opp) bitboards from `color`'s point of view."""
+    return (board.white, board.black) if color == WHITE else (board.black, board.white)
+
+def _disc_diff(own: int, opp: int) -> int:
+    return own.bit_count() - opp.bit_count()
+
+def _corner_diff(own: int, opp: int) -> int:
+    return (own & CORNER_MASK).bit_count() - (opp & CORNER_MASK).bit_count()
+
+def _x_penalty(own: int, opp: int) -> int:
+    if not (own | opp) & X_MASK:
+        return 0 # nobody is on an X-square (most of the early game)
+    # penalize if corresponding corner is not same color: one table lookup + AND + popcount per side
+    return (own & _X_UNGUARDED[own & CORNER_MASK]).bit_count() - (opp & _X_UNGUARDED[opp & CORNER_MASK]).bit_count()
+
+# Fused heuristics helper
+def _features(board: Board, color: int) -> Tuple[int, int, int, int]:
+    """
+    (disc_difference, mobility, corner_control, x_square) for `color`, computed together:
+    the bitboards are read once and shared instead of once per heuristic.
+    """
+    own, opp = _sides(board, color)
+    return (_disc_diff(own, opp),
+            mobility(board, color),
+            _corner_diff(own, opp),
+            _x_penalty(own, opp))
+
 # Game phase helper
+# piece count (0-64) -> phase: early up to 20 pieces, mid up to 58, late after that
+_PHASE_TABLE = tuple('early' if n <= 20 else 'mid' if n <= 58 else 'late' for n in range(65))
+
 def game_phase(board: Board) -> str:
     """Determine the current phase of the game based on the number of pieces on the board."""
-    total_pieces = sum(1 for r in range(board.size) for c in range(board.size) if board.get(r, c) != EMPTY)
-    if total_pieces <= 20:
-        return 'early'
-    elif total_pieces <= 58:
-        return 'mid'
-    else:
-        return 'late'
+    return _PHASE_TABLE[(board.white | board.black).bit_count()] # one lookup by piece count
     
 # Weight schedule helper
-def get_weights(phase: str) -> Dict[str, float]:
-    """Return heuristic weights based on the game phase."""
-    if phase == 'early':
-        return {
-            'disk_difference': 1.0,
-            'mobility': 5.0,
-            'corner_control': 10.0,
-            'x_square_penalty': -8.0,
-            'stable_disks': 2.0
-        }
-    elif phase == 'mid':
-        return {
-            'disk_difference': 2.0,
-            'mobility': 4.0,
-            'corner_control': 12.0,
-            'x_square_penalty': -6.0,
-            'stable_disks': 4.0
-        }
-    else:  # late game
-        return {
-            'disk_difference': 5.0,
-            'mobility': 2.0,
-            'corner_control': 15.0,
-            'x_square_penalty': -4.0,
-            'stable_disks': 6.0
-        }
\ No newline at end of file
+# built once at import; read-only views so a caller can't change the shared schedule by accident
+_WEIGHTS: Dict[str, Mapping[str, float]] = {
+    'early': MappingProxyType({
+        'disk_difference': 1.0,
+        'mobility': 5.0,
+        'corner_control': 10.0,
+        'x_square_penalty': -8.0,
+        'stable_disks': 2.0
+    }),
+    'mid': MappingProxyType({
+        'disk_difference': 2.0,
+        'mobility': 4.0,
+        'corner_control': 12.0,
+        'x_square_penalty': -6.0,
+        'stable_disks': 4.0
+    }),
+    'late': MappingProxyType({
+        'disk_difference': 5.0,
+        'mobility': 2.0,
+        'corner_control': 15.0,
+        'x_square_penalty': -4.0,
+        'stable_disks': 6.0
+    }),
+}
+
+def get_weights(phase: str) -> Mapping[str, float]:
+    """Return heuristic weights based on the game phase (the same shared mapping on every call)."""
+    return _WEIGHTS.get(phase, _WEIGHTS['late']) # anything else counts as late game
+
+
+# --------------------------------- BATCH EVALUATION (NumPy) ---------------------------------
+# Same result as calling evaluate() on each board, but for a whole batch of sibling positions at once,
+# so the interpreter overhead is paid once per batch instead of once per board.
+
+# (shift, mask) for the 8 directions on uint64 arrays; positive shifts move towards higher bits
+_BATCH_DIRECTIONS = ((1, NOT_A), (7, NOT_H), (8, FULL), (9, NOT_A),
+                     (-1, NOT_H), (-7, NOT_A), (-8, FULL), (-9, NOT_H))
+_WEIGHT_KEYS = ('disk_difference', 'mobility', 'corner_control', 'x_square_penalty')
+
+def _popcount(a):
+    """Set bits per element of a uint64 array."""
+    assert np is not None # only reached through evaluate_batch()
+    if hasattr(np, "bitwise_count"): # NumPy >= 2.0
+        return np.bitwise_count(a).astype(np.int64)
+    return np.unpackbits(a.view(np.uint8)).reshape(-1, 64).sum(axis=1).astype(np.int64)
+
+def _legal_moves_batch(own, opp):
+    """Legal-move bitboard for every (own, opp) pair in the arrays (vectorized dumb7fill, see board.legal_moves_bb)."""
+    assert np is not None # only reached through evaluate_batch()
+    moves = np.zeros_like(own)
+    for n, mask in _BATCH_DIRECTIONS:
+        m, k = np.uint64(mask), np.uint64(abs(n))
+        step = (lambda b: (b << k) & m) if n > 0 else (lambda b: (b >> k) & m)
+        t = opp & step(own)
+        for _ in range(5):
+            t |= opp & step(t)
+        moves |= step(t)
+    return moves & ~(own | opp)
+
+def evaluate_batch(white: Sequence[int], black: Sequence[int], color: int):
+    """
+    Vectorized evaluate(): element i is evaluate() of the board (white[i], black[i]) for `color`.
+    Arguments:
+        white, black: bitboards of each position (lists of ints or uint64 arrays)
+        color(int): Color the scores are for
+    Returns:
+        np.ndarray of int64 scores
+    """
+    if np is None:
+        raise ImportError("evaluate_batch() needs numpy (pip install numpy)")
+    white_arr = np.asarray(white, dtype=np.uint64)
+    black_arr = np.asarray(black, dtype=np.uint64)
+    own, opp = (white_arr, black_arr) if color == WHITE else (black_arr, white_arr)
+    own_moves = _legal_moves_batch(own, opp)
+    opp_moves = _legal_moves_batch(opp, own)
+
+    disc_diff = _popcount(own) - _popcount(opp)
+    mob = _popcount(own_moves) - _popcount(opp_moves)
+    corner_mask = np.uint64(CORNER_MASK)
+    corners = _popcount(own & corner_mask) - _popcount(opp & corner_mask)
+    x_sq = np.zeros(len(own), dtype=np.int64)
+    for x_bit, corner_bit in _X_CORNER_BITS:
+        x, corner = np.uint64(x_bit), np.uint64(corner_bit)
+        x_sq += ((own & x) != 0) & ((own & corner) == 0)
+        x_sq -= ((opp & x) != 0) & ((opp & corner) == 0)
+
+    # same thresholds as game_phase(): 0 = early, 1 = mid, 2 = late
+    total = _popcount(own | opp)
+    phase = np.where(total <= 20, 0, np.where(total <= 58, 1, 2))
+    w = _BATCH_WEIGHTS[phase]
+    score = w[:, 0] * disc_diff + w[:, 1] * mob + w[:, 2] * corners + w[:, 3] * x_sq
+    score = np.rint(score).astype(np.int64) # rint rounds half to even, like round() in evaluate()
+
+    is_end = (own_moves == 0) & (opp_moves == 0)
+    return np.where(is_end, 1000 * disc_diff, score)
+
+if np is not None:
+    # one row of weights per phase, in _WEIGHT_KEYS order
+    _BATCH_WEIGHTS = np.array([[get_weights(phase)[k] for k in _WEIGHT_KEYS] for phase in ('early', 'mid', 'late')])
@@ -2,30 +2,45 @@
 from __future__ import annotations
 import sys
 
+FLUSH_EVERY = 64 # debug file is flushed once per this many messages (and on stop()), not after every write
+
 class DebugLogger:
     def __init__(self):
         self.enabled = False
         self.file = None
+        self.pending = 0 # messages written to the file since the last flush
 
     def start(self, filename="debug.txt"):
         self.enabled = True
         self.file = open(filename, "w", encoding="utf-8")
+        self.pending = 0
 
     def stop(self):
         if self.file:
-            self.file.close()
+            self.file.close() # close() flushes whatever is still buffered
         self.enabled = False
 
+    def flush(self):
+        """Push buffered log messages to disk now."""
+        if self.enabled and self.file:
+            self.file.flush()
+        self.pending = 0
+
     def write(self, msg: str):
         """Write msg to screen and also to debug file if enabled."""
-        # Always print to the terminal
+        # Always print to stdout. An interactive terminal is line-buffered, so there only prompts
+        # (no trailing newline) need an explicit flush; piped/redirected stdout is block-buffered
+        # and is flushed on every write so the reader sees each line as it happens
         sys.stdout.write(msg)
-        sys.stdout.flush()
+        if not msg.endswith("\n") or not sys.stdout.isatty():
+            sys.stdout.flush()
 
-        # Also write to log file if enabled
+        # Also write to log file if enabled (buffered: one flush per FLUSH_EVERY messages)
         if self.enabled and self.file:
             self.file.write(msg)
-            self.file.flush()
+            self.pending += 1
+            if self.pending >= FLUSH_EVERY:
+                self.flush()
 
 # Create ONE shared logger used everywhere
 LOGGER = DebugLogger()
@@ -33,4 +48,4 @@ LOGGER = DebugLogger()
 def dprint(*args, end="\n"):
     """Debug print: writes to both terminal and debug log file if enabled."""
     msg = " ".join(str(a) for a in args) + end
-    LOGGER.write(msg)
\ No newline at end of file
+    LOGGER.write(msg)
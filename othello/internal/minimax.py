@@ -5,26 +5,49 @@ from dataclasses import dataclass, field
 from typing import List, Optional, Tuple, Dict
 import math
 
-from .board import Board, WHITE, BLACK, EMPTY, opponent  # uses existing constants
+from .board import Board, WHITE, BLACK, EMPTY  # uses existing constants
 from .heuristics import evaluate        # will add a basic eval in heuristics.py
-from .utils import to_algebra  # for debug printing
+from .heuristics import evaluate_batch, NUMPY_AVAILABLE
+from .utils import to_algebra, BOARD_SIZE  # for debug printing
 from .utils import from_algebra
 from .log import dprint
 
-@dataclass
+# transposition table entry flags: is the stored value exact, or only a bound from an alpha-beta cutoff?
+EXACT, LOWER, UPPER = 0, 1, 2
+_CORNERS = frozenset({(0, 0), (0, BOARD_SIZE - 1), (BOARD_SIZE - 1, 0), (BOARD_SIZE - 1, BOARD_SIZE - 1)}) # for _inorder, hashed once
+NEG_INF, POS_INF = -math.inf, math.inf # search window bounds, bound once instead of looked up on math per node
+MAX_PLY = 64 # deeper than any Othello game (60 moves), sizes the killer-move table
+TT_MAX_ENTRIES = 1 << 20 # the transposition table is emptied between moves once it grows past this
+
+def _empty_killers() -> List[List[Optional[Tuple[int, int]]]]:
+    """A killer-move table with 2 empty slots per ply."""
+    return [[None, None] for _ in range(MAX_PLY)]
+
+@dataclass(slots=True) # fixed attribute slots: faster attribute access in the search than a per-instance __dict__
 class Minimax:
     depth: int = 3
     alpha_beta: bool = True
     debug : bool = False
+    batch_eval: bool = False # experimental, off by default: score depth-1 frontiers with heuristics.evaluate_batch (needs numpy; measured ~3x slower)
     
     # runtime fields (set per move)
     nodes_searched: int = 0 
     root_color: int = BLACK
-    move_evals: List[Tuple[Tuple[int, int], int]] = field(default_factory=list)  # [ (move, eval) ] - List of moves ((row, col), eval)
+    move_evals: List[Tuple[Tuple[int, int], float]] = field(default_factory=list)  # [ (move, eval) ] - List of moves ((row, col), eval)
+    _tt: Dict[Tuple[int, int, int, int], Tuple[int, float, Optional[Tuple[int, int]]]] = field(default_factory=dict, init=False, repr=False) # (white, black, color to move, depth) -> (flag, value for the side to move, best move)
+    killers: List[List[Optional[Tuple[int, int]]]] = field(default_factory=_empty_killers, init=False, repr=False) # per ply: the 2 latest moves that caused a beta cutoff
 
     def reset_counters(self) -> None:
         self.nodes_searched = 0
         self.move_evals = [] # list of (move, eval) tuples
+        self.killers = _empty_killers()
+        # the transposition table is kept: its entries don't depend on the root, so later moves reuse them
+        if len(self._tt) > TT_MAX_ENTRIES:
+            self.clear_tt()
+
+    def clear_tt(self) -> None:
+        """ Forget every cached position (e.g. for a new game). """
+        self._tt = {}
 
     # entry point
     def choose_move(self, board: Board, color: int) -> Optional[Tuple[int, int]]: #Optional Tuple containing row and column represents a move
@@ -46,20 +69,38 @@ class Minimax:
         moves = self._inorder(board, color, moves)
 
         best_move = None
-        # For the player at the root, we are maximizing from root_color POV
-        best_eval = -math.inf
+        best_eval = NEG_INF
 
-        alpha, beta = -math.inf, math.inf
-        alpha = alpha
-        beta = beta
+        # Iterative deepening: search depth 1, 2, ... self.depth. Each pass puts the previous best move
+        # first, and fills the transposition table / killer moves that order the next, deeper pass.
+        for depth in range(1, self.depth + 1):
+            if best_move is not None:
+                moves = [best_move] + [m for m in moves if m != best_move]
+            best_move, best_eval = self._search_root(board, color, moves, depth)
+
+        # Final debug printing
+        if self.debug:
+            scored = [f"{to_algebra(mv)}: {ev:+.0f}" for mv, ev in self.move_evals]
+            dprint(f"[debug] nodes={self.nodes_searched} depth={self.depth} alpha-beta={'ON' if self.alpha_beta else 'OFF'}")
+            dprint(f"[debug] root move scores: {scored}")
+            if best_move:
+                dprint(f"[debug] chosen: {to_algebra(best_move)} (eval {best_eval:+.0f})")
+        return best_move
+
+    def _search_root(self, board: Board, color: int, moves: List[Tuple[int, int]], depth: int) -> Tuple[Optional[Tuple[int, int]], float]:
+        """ One fixed-depth pass over the root moves (in the given order). Returns (best move, its eval). """
+        self.move_evals = [] # only the deepest pass is kept for debug output
+        best_move = None
+        # For the player at the root, we are maximizing from root_color POV
+        best_eval = NEG_INF
+        alpha, beta = NEG_INF, POS_INF
 
         for (r, c) in moves:
-            child = board.copy()
-            child.apply_move(r, c, color)
+            token = board.make_move(r, c, color)
 
-            # Next ply: opponent to move
-            # maximizing_player is True if opponent is root_color
-            val = self.minimax(child,self.depth - 1, alpha, beta, maximizing_player=opponent(color))
+            # Next ply: opponent to move, so the child is a minimizing node from root_color's point of view
+            val = self.minimax(board, depth - 1, alpha, beta, maximizing_player=False)
+            board.unmake_move(token)
 
             self.move_evals.append(((r, c), val))
 
@@ -73,67 +114,151 @@ class Minimax:
                     if self.debug:
                         dprint("[debug] root alpha-beta cutoff")
                     break
-        # Final debug printing
-        if self.debug:
-            scored = [f"{to_algebra(mv)}: {ev:+.0f}" for mv, ev in self.move_evals]
-            dprint(f"[debug] nodes={self.nodes_searched} depth={self.depth} alpha-beta={'ON' if self.alpha_beta else 'OFF'}")
-            dprint(f"[debug] root move scores: {scored}")
-            if best_move:
-                dprint(f"[debug] chosen: {to_algebra(best_move)} (eval {best_eval:+.0f})")
-        return best_move
+        return best_move, best_eval
 
     # recursive minimax function
 
-    # ============ V1
-    def minimax(self, board: Board, depth: int, alpha: int, beta: int, maximizing_player: bool) -> int:
+    # ============ V2 (negamax)
+    def minimax(self, board: Board, depth: int, alpha: float, beta: float, maximizing_player: bool) -> float:
         """ 
         Minimax algorithm with optional alpha-beta pruning. 
+        Thin wrapper around `_negamax` that keeps the classic max/min interface.
         Arguments:
             board: Poition or board state to evaluate
             depth: Current depth in the game tree
             alpha: Alpha value for pruning
             beta: Beta value for pruning
-            maximizing_player: True if the current layer is maximizing, False if minimizing
+            maximizing_player: True if root_color is to move (maximizing layer), False if the opponent is (minimizing layer)
+        Returns:
+            The value of `board` from root_color's point of view.
         """
-        if depth == 0 or board.is_end():
-            return evaluate(board, self.root_color)
-        
         if maximizing_player:
-            max_eval = -math.inf
-            # for each legal move in current board state
-            for (r, c) in board.legal_moves(self.root_color):
-                child = board.copy()    # create an empty board state representing the legal move
-                child.apply_move(r, c, self.root_color) # apply the move to the child board
-
-                eval = self.minimax(child, depth - 1, alpha, beta, False)
-                max_eval = max(max_eval, eval)
-                alpha = max(alpha, eval)
-
-                if beta <= alpha and self.alpha_beta:
-                    break  # prune remaining branches
-            return max_eval
-        
-        if not maximizing_player:
-            min_eval = math.inf
-            # for each legal move in current board state
-            for (r, c) in board.legal_moves(self.root_color):
-                child = board.copy()    # create an empty board state representing the legal move
-                child.apply_move(r, c, self.root_color) # apply the move to the child board
-
-                eval = self.minimax(child, depth - 1, alpha, beta, False)
-                min_eval = min(min_eval, eval)
-                beta = min(beta, eval)
-
-                if beta <= alpha and self.alpha_beta:
-                    break  # prune remaining branches
-            return min_eval
+            return self._negamax(board, depth, alpha, beta, self.root_color)
+        # the opponent maximizes its own score, which is the negation of ours (window flips too)
+        return -self._negamax(board, depth, -beta, -alpha, -self.root_color) # -root_color is opponent(root_color), inlined
+
+    def _negamax(self, board: Board, depth: int, alpha: float, beta: float, color: int, ply: int = 1) -> float:
+        """
+        Negamax search: returns the value of `board` from the point of view of `color`, the side to move.
+        One branch covers both players because max(a, b) == -min(-a, -b) and `evaluate` is symmetric.
+        With alpha-beta on this is a principal-variation search: the first (best-ordered) move gets the
+        full window, the others a null window that only proves they are worse, re-searched if they are not.
+        `ply` is the distance from the root, used to index the killer-move table.
+        """
+        self.nodes_searched += 1
+        if depth == 0 or board.is_end():
+            return evaluate(board, color)
+        alpha_beta, tt = self.alpha_beta, self._tt # hoisted: the move loop below only touches locals
+
+        # transposition table probe: the same position is often reached through different move orders
+        key = (board.white, board.black, color, depth)
+        entry = tt.get(key)
+        tt_move = None
+        if entry is not None:
+            flag, value, tt_move = entry
+            if flag == EXACT or (flag == LOWER and value >= beta) or (flag == UPPER and value <= alpha):
+                return value
+        alpha_orig = alpha
+        best_move = None
+
+        flips = dict(board.legal_moves_flips(color)) # (row, col) -> flipped discs, so moves are applied unchecked
+        moves = list(flips)
+        if not moves:
+            # no legal move but the game is not over: pass the turn to the opponent
+            value = -self._negamax(board, depth - 1, -beta, -alpha, -color, ply + 1)
+        elif depth == 1 and self.batch_eval and NUMPY_AVAILABLE:
+            # frontier node: every child is a leaf, so score them all in one vectorized call
+            value = self._frontier_value(board, color, moves, flips)
+        else:
+            if depth > 1:
+                # children of a depth-1 node are leaves, ordering them would cost as much as searching them
+                moves = self._order_moves(board, color, moves, flips)
+            # best move from an earlier (shallower) search of this position first, then this ply's killers
+            moves = self._promote(moves, (tt_move, *self.killers[ply]))
+            value = NEG_INF
+            for i, (r, c) in enumerate(moves):
+                token = board.make_move(r, c, color, flips[(r, c)]) # play the move on the shared board
+                if i == 0 or not alpha_beta:
+                    eval = -self._negamax(board, depth - 1, -beta, -alpha, -color, ply + 1) # -color is opponent(color), inlined
+                else:
+                    eval = -self._negamax(board, depth - 1, -alpha - 1, -alpha, -color, ply + 1) # null window
+                    if alpha < eval < beta:
+                        eval = -self._negamax(board, depth - 1, -beta, -alpha, -color, ply + 1) # it was better: full re-search
+                board.unmake_move(token) # and take it back before trying the next one
+                if eval > value:
+                    value = eval
+                    best_move = (r, c)
+
+                if alpha_beta:
+                    alpha = max(alpha, eval)
+                    if beta <= alpha:
+                        self._store_killer(ply, (r, c))
+                        break  # prune remaining branches
+
+        # store with a bound flag so a cutoff value is never reused as an exact score
+        if value <= alpha_orig:
+            flag = UPPER
+        elif value >= beta:
+            flag = LOWER
+        else:
+            flag = EXACT
+        tt[key] = (flag, value, best_move)
+        return value
         
 
 
     # ---- helper functions ----
+    def _frontier_value(self, board: Board, color: int, moves: List[Tuple[int, int]], flips: Optional[Dict[Tuple[int, int], int]] = None) -> int:
+        """
+        Value of a depth-1 node for `color`: the best leaf among its children, scored with evaluate_batch.
+        Since evaluate is symmetric, -evaluate(child, opponent) == evaluate(child, color), so this matches
+        what the negamax loop would return (no pruning, but no per-child interpreter overhead either).
+        """
+        whites, blacks = [], []
+        for (r, c) in moves:
+            token = board.make_move(r, c, color, flips[(r, c)] if flips else None)
+            whites.append(board.white)
+            blacks.append(board.black)
+            board.unmake_move(token)
+        self.nodes_searched += len(moves)
+        return int(evaluate_batch(whites, blacks, color).max())
+
     def _inorder(self, board: Board, color: int, moves: List[Tuple[int, int]]) -> List[Tuple[int, int]]:
         """ Simple move ordering: prioritize corners, then others. """
-        corners = [(0, 0), (0, board.size - 1), (board.size - 1, 0), (board.size - 1, board.size - 1)]
+        last = board.size - 1
+        corners = _CORNERS if last == BOARD_SIZE - 1 else frozenset({(0, 0), (0, last), (last, 0), (last, last)})
         corner_moves = [m for m in moves if m in corners]
         other_moves = [m for m in moves if m not in corners]
-        return corner_moves + other_moves
\ No newline at end of file
+        return corner_moves + other_moves
+
+    def _promote(self, moves: List[Tuple[int, int]], first: Tuple[Optional[Tuple[int, int]], ...]) -> List[Tuple[int, int]]:
+        """ Move the legal ones among `first` (in that order, skipping None) to the front of `moves`. """
+        front = []
+        for m in first:
+            if m is not None and m in moves and m not in front:
+                front.append(m)
+        if not front:
+            return moves
+        return front + [m for m in moves if m not in front]
+
+    def _store_killer(self, ply: int, move: Tuple[int, int]) -> None:
+        """ Remember a move that caused a beta cutoff at this ply (2 slots, newest first). """
+        slots = self.killers[ply]
+        if slots[0] != move:
+            slots[1] = slots[0]
+            slots[0] = move
+
+    def _order_moves(self, board: Board, color: int, moves: List[Tuple[int, int]], flips: Optional[Dict[Tuple[int, int], int]] = None) -> List[Tuple[int, int]]:
+        """
+        Shallow-eval move ordering: score each child with `evaluate` (depth 0) and try the best first,
+        so alpha-beta finds strong moves early and prunes more. `_inorder` runs first and the sort is
+        stable, so corners-first only decides between moves that evaluate the same.
+        `flips` (move -> flipped discs) lets the moves be applied without recomputing their flips.
+        """
+        scored = []
+        for (r, c) in self._inorder(board, color, moves):
+            token = board.make_move(r, c, color, flips[(r, c)] if flips else None)
+            scored.append((evaluate(board, color), (r, c)))
+            board.unmake_move(token)
+        scored.sort(key=lambda item: item[0], reverse=True)
+        return [move for _, move in scored]
\ No newline at end of file
@@ -0,0 +1,88 @@
+# internal/search_jit.py
+
+# Numba-compiled bitboard kernels for the search hot path.
+# Numba is optional (pip install numba): without it this module still imports, NUMBA_AVAILABLE is False
+# and board.py keeps using its pure-Python kernels.
+# Same bit layout as board.py: bit (r * 8 + c) is square (r, c). Kept free of project imports so board.py can import it.
+from __future__ import annotations
+
+try:
+    from numba import njit, uint64
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+    uint64 = int # type: ignore[assignment, misc]
+
+    def njit(*args, **kwargs): # type: ignore[no-redef]
+        """Stand-in for numba.njit: leaves the function as plain Python."""
+        def wrap(fn):
+            return fn
+        return wrap
+
+FULL = 0xFFFFFFFFFFFFFFFF
+NOT_A = 0xfefefefefefefefe # every square except column a (kills wraparound when shifting east)
+NOT_H = 0x7f7f7f7f7f7f7f7f # every square except column h (kills wraparound when shifting west)
+
+# Every value is a uint64 so Numba never mixes signed and unsigned ints (which it would promote to float).
+# The `& mask` after each left shift also drops bits past square 63 in the pure-Python fallback.
+
+@njit("uint64(uint64, uint64, uint64, uint64)", cache=True, nogil=True)
+def _moves_left(own, opp, n, mask):
+    """Legal-move squares found by flooding from `own` through `opp` towards higher bits (shift left by n)."""
+    t = opp & ((own << n) & mask)
+    for _ in range(5): # a run of opponent discs is at most 6 long
+        t |= opp & ((t << n) & mask)
+    return (t << n) & mask
+
+@njit("uint64(uint64, uint64, uint64, uint64)", cache=True, nogil=True)
+def _moves_right(own, opp, n, mask):
+    """Same as _moves_left, towards lower bits (shift right by n)."""
+    t = opp & ((own >> n) & mask)
+    for _ in range(5):
+        t |= opp & ((t >> n) & mask)
+    return (t >> n) & mask
+
+@njit("uint64(uint64, uint64)", cache=True, nogil=True)
+def legal_moves_bb(own, opp):
+    """Bitboard of every legal move for the side owning `own` (dumb7fill over the 8 directions)."""
+    moves = (_moves_left(own, opp, uint64(1), uint64(NOT_A))     # east
+             | _moves_left(own, opp, uint64(7), uint64(NOT_H))   # south-west
+             | _moves_left(own, opp, uint64(8), uint64(FULL))    # south
+             | _moves_left(own, opp, uint64(9), uint64(NOT_A))   # south-east
+             | _moves_right(own, opp, uint64(1), uint64(NOT_H))  # west
+             | _moves_right(own, opp, uint64(7), uint64(NOT_A))  # north-east
+             | _moves_right(own, opp, uint64(8), uint64(FULL))   # north
+             | _moves_right(own, opp, uint64(9), uint64(NOT_H))) # north-west
+    return moves & ~(own | opp)
+
+@njit("uint64(uint64, uint64, uint64, uint64, uint64)", cache=True, nogil=True)
+def _flips_left(own, opp, move, n, mask):
+    """Opponent discs flipped along one direction (shift left by n) when `move` is played."""
+    line = uint64(0)
+    x = (move << n) & mask
+    while x & opp:
+        line |= x
+        x = (x << n) & mask
+    return line if x & own else uint64(0)
+
+@njit("uint64(uint64, uint64, uint64, uint64, uint64)", cache=True, nogil=True)
+def _flips_right(own, opp, move, n, mask):
+    """Same as _flips_left, towards lower bits (shift right by n)."""
+    line = uint64(0)
+    x = (move >> n) & mask
+    while x & opp:
+        line |= x
+        x = (x >> n) & mask
+    return line if x & own else uint64(0)
+
+@njit("uint64(uint64, uint64, uint64)", cache=True, nogil=True)
+def flips_bb(own, opp, move):
+    """Bitboard of opponent discs flipped when the side owning `own` plays the single bit `move` (0 if none)."""
+    return (_flips_left(own, opp, move, uint64(1), uint64(NOT_A))
+            | _flips_left(own, opp, move, uint64(7), uint64(NOT_H))
+            | _flips_left(own, opp, move, uint64(8), uint64(FULL))
+            | _flips_left(own, opp, move, uint64(9), uint64(NOT_A))
+            | _flips_right(own, opp, move, uint64(1), uint64(NOT_H))
+            | _flips_right(own, opp, move, uint64(7), uint64(NOT_A))
+            | _flips_right(own, opp, move, uint64(8), uint64(FULL))
+            | _flips_right(own, opp, move, uint64(9), uint64(NOT_H)))
@@ -13,21 +13,12 @@ def to_algebra(move: Tuple[int, int]) -> str:
 
 def from_algebra(token: str) -> Optional[Tuple[int, int]]:
     """'d3' or 'A8' -> (row, col) zero-based. Returns None if invalid/out of range."""
-    if not token or len(token) < 2 or len(token) > 3:
+    if not token:
         return None
-    t = token.strip().lower()
-    col_ch = t[0]
-    if not ('a' <= col_ch <= 'h'):
-        return None
-    try:
-        row_num = int(t[1:])
-    except ValueError:
-        return None
-    if not (1 <= row_num <= BOARD_SIZE):
-        return None
-    row_idx = row_num - 1
-    col_idx = ord(col_ch) - ord('a')
-    return (row_idx, col_idx)
+    return ALGEBRA_TO_RC.get(token.strip().lower()) # one lookup instead of slicing + int() parsing
+
+# every valid square name ('a1' .. 'h8') -> (row, col), so parsing is a single dict lookup
+ALGEBRA_TO_RC = {to_algebra((r, c)): (r, c) for r in range(BOARD_SIZE) for c in range(BOARD_SIZE)}
 
 def in_bounds(r: int, c: int, size: int = BOARD_SIZE) -> bool:
     return 0 <= r < size and 0 <= c < size # if row is between 0 and size-1 and col is between 0 and size-1
\ No newline at end of file
@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 from pathlib import Path
+import sys
 
 
 from .internal.board import Board, WHITE, BLACK
@@ -12,8 +13,14 @@ from .internal.log import dprint, LOGGER
 
 run = True
 def main() -> None:
+    try:
+        _play()
+    finally:
+        LOGGER.stop() # closing the debug log flushes whatever is still buffered
+
+def _play() -> None:
     board = Board.initial()
-    minimax = Minimax(depth=4, alpha_beta=True, debug=True)
+    minimax = Minimax(depth=4, alpha_beta=True, debug="--debug" in sys.argv[1:]) # debug log only with: python -m othello.main --debug
     log_path = (Path(__file__).resolve().parent / "debugs"/"debug.txt").as_posix()
     if minimax.debug:
         LOGGER.start(str(log_path))
@@ -125,17 +132,16 @@ def main() -> None:
             input()
 
     display_board(board)
-    s = board.score()
-    if s["white"] > s["black"]:
+    white, black = board.score()
+    if white > black:
         run = False
         dprint("\nGame over. White (●) wins!")
-    elif s["black"] > s["white"]:
+    elif black > white:
         run = False
         dprint("\nGame over. Black (○) wins!")
     else:
         run = False
         dprint("\nGame over. Draw!")
-LOGGER.stop()
 print("Reached end of main()")
 if run == True:
     main()
@@ -2,6 +2,9 @@
 
 import pytest
 import importlib
+import sys
+
+from othello.internal.log import LOGGER, DebugLogger
 
 
 # ========================== helpers for safe import ==========================
@@ -77,4 +80,26 @@ def test_main_quick_quit_human_vs_human(monkeypatch):
     main_module = _safe_import_main(monkeypatch, input_values=["1", "q"])
 
     # We don't assert game result here, just that main() exists and import didn't crash
-    assert hasattr(main_module, "main"), "main module should define a main() function"
\ No newline at end of file
+    assert hasattr(main_module, "main"), "main module should define a main() function"
+
+
+# ========================== test debug log on game end ==========================
+def test_main_flushes_debug_log_when_game_ends(monkeypatch, tmp_path):
+    """
+    With --debug, everything logged during the game should be on disk once main() returns,
+    even though the game wrote fewer than FLUSH_EVERY messages.
+    """
+    main_module = _safe_import_main(monkeypatch, input_values=["1", "q"])
+
+    # run main() again, this time logging for real into tmp_path
+    inputs = iter(["1", "q"])
+    monkeypatch.setattr("builtins.input", lambda prompt="": next(inputs))
+    monkeypatch.setattr(sys, "argv", ["othello", "--debug"])
+    log_file = tmp_path / "debug.txt"
+    monkeypatch.setattr(LOGGER, "start", lambda filename="debug.txt": DebugLogger.start(LOGGER, str(log_file)))
+    monkeypatch.setattr(LOGGER, "stop", lambda: DebugLogger.stop(LOGGER))
+
+    main_module.main()
+
+    assert "Welcome to Othello!" in log_file.read_text(encoding="utf-8"), "the debug log should be flushed when the game ends"
+    assert LOGGER.enabled is False, "main() should stop the logger on the way out"
@@ -0,0 +1,47 @@
+# othello/tests/unit/conftest.py
+
+import pytest
+from othello.internal.board import BLACK
+from othello.internal.minimax import Minimax
+
+# ============================== shared Minimax instances ==============================
+# One Minimax per configuration for the whole session; the function-scoped fixtures below
+# hand it out with its per-move state reset, so tests never see each other's counters.
+
+@pytest.fixture(scope="session")
+def _minimax_default_session():
+    return Minimax()
+
+
+# alpha-beta search configurations, keyed by the test id they run under
+AB_CONFIGS = {
+    "d2": {"depth": 2, "alpha_beta": True, "debug": False},
+    "d3": {"depth": 3, "alpha_beta": True, "debug": False},
+}
+
+
+@pytest.fixture(scope="session")
+def _minimax_ab_session():
+    return {name: Minimax(**config) for name, config in AB_CONFIGS.items()}
+
+
+def _fresh(minimax):
+    """Reset everything a test (or a previous search) may have changed."""
+    minimax.reset_counters()
+    minimax.clear_tt()  # the transposition table outlives reset_counters()
+    minimax.root_color = BLACK
+    return minimax
+
+
+@pytest.fixture
+def minimax_default(_minimax_default_session):
+    """Minimax() with default settings, counters reset."""
+    return _fresh(_minimax_default_session)
+
+
+@pytest.fixture(params=list(AB_CONFIGS), ids=list(AB_CONFIGS))
+def minimax_ab(request, _minimax_ab_session):
+    """Alpha-beta Minimax for each of AB_CONFIGS (tests using it run once per config), counters reset."""
+    minimax = _fresh(_minimax_ab_session[request.param])
+    yield minimax
+    minimax.reset_counters()
@@ -7,7 +7,11 @@ from othello.internal.board import (
     WHITE,
     BLACK,
     EMPTY,
+    _legal_moves_loop,
+    legal_moves_unrolled,
+    _flips_bb_py,
 )
+from othello.internal import search_jit
 
 # ============================== Fixtures ==============================
 @pytest.fixture
@@ -56,10 +60,8 @@ def test_copy_creates_independent_board(initial_board):
     # Boards should not be the same object
     assert copied is not initial_board
 
-    # Grids should not be the same object either
-    assert copied.grid is not initial_board.grid
-
-    # But contents should start out identical
+    # Contents should start out identical (the bitboards are immutable ints, so sharing them is fine;
+    # independence is about values, checked below, not about object identity)
     assert copied.grid == initial_board.grid
 
     # Now modify the copy and ensure original does not change
@@ -68,6 +70,16 @@ def test_copy_creates_independent_board(initial_board):
     assert initial_board.get(0, 0) == EMPTY, "Original board should not be affected by changes to the copy"
 
 
+def test_boards_compare_and_hash_by_position(initial_board):
+    copied = initial_board.copy()
+    assert copied == initial_board
+    assert hash(copied) == hash(initial_board)
+    assert len({copied, initial_board}) == 1, "equal positions should collapse to one set entry"
+
+    copied.apply_move(2, 3, BLACK)
+    assert copied != initial_board
+
+
 # ============================== test get() and set() ==============================
 def test_get_and_set_place_piece():
     board = Board()
@@ -75,6 +87,26 @@ def test_get_and_set_place_piece():
 
     assert board.get(3, 4) == WHITE, "set() should place the correct color at the given position"
 
+def test_cells_matches_get(initial_board):
+    """cells() should decode every square the same way get() does, flattened row by row."""
+    initial_board.set(0, 7, BLACK)
+    size = initial_board.size
+    assert initial_board.cells() == [initial_board.get(r, c) for r in range(size) for c in range(size)]
+
+
+def test_from_bitboards_builds_position_and_rejects_overlap():
+    board = Board.from_bitboards(1 << (3 * 8 + 4), 1)
+    assert board.get(3, 4) == WHITE
+    assert board.get(0, 0) == BLACK
+    assert board.score() == (1, 1)
+
+    with pytest.raises(ValueError):
+        Board.from_bitboards(1, 1) # (0, 0) cannot be both colors
+    with pytest.raises(ValueError):
+        Board.from_bitboards(1 << 70, 0) # no square 70 on an 8x8 board
+    with pytest.raises(ValueError):
+        Board.from_bitboards(0, -1) # negative ints have every high bit set
+
 
 # ============================== test in_bounds wrapper ==============================
 def test_board_in_bounds_wrapper():
@@ -99,8 +131,13 @@ def test_score_counts_pieces_correctly(initial_board):
     initial_board.set(0, 1, BLACK)
 
     new_score = initial_board.score()
-    assert new_score["white"] == 3
-    assert new_score["black"] == 3
+    assert new_score.white == 3
+    assert new_score.black == 3
+    assert new_score == (3, 3), "score() should unpack as (white, black)"
+
+    for key in ("count", "_fields", "empty"): # tuple/NamedTuple attributes are not score keys
+        with pytest.raises(KeyError):
+            new_score[key]
 
 
 # ============================== test to_string() ==============================
@@ -115,10 +152,9 @@ def test_to_string_basic_format(initial_board):
     # There should be size + 1 lines (header + each row)
     assert len(lines) == Board.size + 1
 
-    # The number of '●' and '○' should match score()
-    joined = "\n".join(lines)
-    white_count = joined.count("●")
-    black_count = joined.count("○")
+    # The number of '●' and '○' should match score() (counted on the rendered string directly)
+    white_count = board_str.count("●")
+    black_count = board_str.count("○")
     score = initial_board.score()
     assert white_count == score["white"]
     assert black_count == score["black"]
@@ -171,6 +207,37 @@ def test_legal_moves_initial_white(initial_board):
     assert len(moves) > 0, "WHITE should have at least one legal move at the start"
 
 
+def test_legal_moves_unrolled_matches_loop(initial_board):
+    """The generated straight-line move generator should agree with the looped reference on every position."""
+    board = initial_board
+    color = BLACK
+    for _ in range(20): # play a short game, always taking the first legal move
+        for own, opp in ((board.black, board.white), (board.white, board.black)):
+            assert legal_moves_unrolled(own, opp) == _legal_moves_loop(own, opp)
+        moves = board.legal_moves(color)
+        if moves:
+            board.apply_move(*moves[0], color)
+        color = opponent(color)
+
+
+def test_search_jit_kernels_match_pure_python(initial_board):
+    """search_jit's kernels (compiled, or plain Python without Numba) should agree with board.py's pure-Python ones."""
+    board = initial_board
+    color = BLACK
+    while not board.is_end(): # play a whole game, always taking the first legal move
+        for own, opp in ((board.black, board.white), (board.white, board.black)):
+            moves = legal_moves_unrolled(own, opp)
+            assert search_jit.legal_moves_bb(own, opp) == moves
+            while moves:
+                move = moves & -moves
+                assert search_jit.flips_bb(own, opp, move) == _flips_bb_py(own, opp, move), f"flips differ for bit {move:#x}"
+                moves ^= move
+        moves = board.legal_moves(color)
+        if moves:
+            board.apply_move(*moves[0], color)
+        color = opponent(color)
+
+
 # ============================== test apply_move() ==============================
 def test_apply_move_flips_pieces_correctly(initial_board):
     """
@@ -202,6 +269,19 @@ def test_apply_move_raises_for_invalid_move():
         board.apply_move(0, 0, BLACK)
 
 
+# ============================== test make_move() / unmake_move() ==============================
+def test_make_move_then_unmake_restores_position(initial_board):
+    """make_move() should apply the move in place and unmake_move() should undo it exactly."""
+    before = initial_board.copy()
+
+    token = initial_board.make_move(2, 3, BLACK)
+    assert initial_board.get(2, 3) == BLACK, "make_move() should place the piece"
+    assert initial_board.get(3, 3) == BLACK, "make_move() should flip like apply_move()"
+
+    initial_board.unmake_move(token)
+    assert initial_board.grid == before.grid, "unmake_move() should restore the original position"
+
+
 # ============================== test hasMoves() and is_end() ==============================
 def test_hasMoves_and_is_end_initial(initial_board):
     """At the start of the game, both players should have moves and the game is not over."""
@@ -215,12 +295,30 @@ def test_is_end_when_board_full_no_moves():
     If the board is completely full of one color, neither side has moves
     and is_end() should return True.
     """
-    board = Board()
-    # Fill board with WHITE
-    for r in range(board.size):
-        for c in range(board.size):
-            board.set(r, c, WHITE)
+    board = Board.from_bitboards((1 << (Board.size * Board.size)) - 1, 0) # Fill board with WHITE
 
     assert board.hasMoves(WHITE) is False
     assert board.hasMoves(BLACK) is False
-    assert board.is_end() is True
\ No newline at end of file
+    assert board.is_end() is True
+
+# ============================== test legal_moves_flips() / apply_move_unchecked() ==============================
+def test_legal_moves_flips_matches_flips(initial_board):
+    """legal_moves_flips() should pair every legal move with the same discs flips() reports."""
+    pairs = initial_board.legal_moves_flips(BLACK)
+    assert {move for move, _ in pairs} == set(initial_board.legal_moves(BLACK))
+
+    for (r, c), flips_mask in pairs:
+        expected = 0
+        for fr, fc in initial_board.flips(r, c, BLACK):
+            expected |= 1 << (fr * Board.size + fc)
+        assert flips_mask == expected, f"flips bitboard for {(r, c)} should match flips()"
+
+
+def test_apply_move_unchecked_matches_apply_move(initial_board):
+    """apply_move_unchecked() with a precomputed flips bitboard should give the same board as apply_move()."""
+    (r, c), flips_mask = initial_board.legal_moves_flips(BLACK)[0]
+    checked = initial_board.copy()
+    checked.apply_move(r, c, BLACK)
+
+    initial_board.apply_move_unchecked(r, c, BLACK, flips_mask)
+    assert initial_board.grid == checked.grid
@@ -1,4 +1,5 @@
 import pytest
+from unittest.mock import patch
 from othello.internal.cli import (
     clear_screen,
     parse_move,
@@ -72,29 +73,27 @@ def test_parse_move_non_numeric(token):
 
 # ============================== test display_board ==============================
 
-def test_display_board_calls_clear_and_dprint(mocker):
+def test_display_board_calls_clear_and_dprint():
     """
     display_board should:
     - call clear_screen()
     - call dprint(board.to_string())
     - call dprint() again for the score line
     """
-    # Patch clear_screen and dprint so we can inspect the calls
-    clear_mock = mocker.patch("othello.internal.cli.clear_screen")
-    dprint_mock = mocker.patch("othello.internal.cli.dprint")
-
     # Create a simple fake Board with the minimal API
     class FakeBoard:
         def to_string(self):
             return "BOARD ASCII"
 
         def score(self):
-            return {"white": 10, "black": 8}
+            return (10, 8) # (white, black), like Board.score()
 
     board = FakeBoard()
 
-    # Call the function under test
-    display_board(board)
+    # Patch clear_screen and dprint so we can inspect the calls, then call the function under test
+    with patch("othello.internal.cli.clear_screen") as clear_mock, \
+         patch("othello.internal.cli.dprint") as dprint_mock:
+        display_board(board)
 
     # clear_screen should be called once
     clear_mock.assert_called_once()
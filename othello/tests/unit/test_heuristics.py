@@ -1,6 +1,7 @@
 # othello/tests/unit/test_heuristics.py
 
 import pytest
+from unittest.mock import patch
 
 from othello.internal.heuristics import (
     evaluate,
@@ -10,9 +11,12 @@ from othello.internal.heuristics import (
     x_square,
     game_phase,
     get_weights,
+    evaluate_batch,
+    _features,
 )
 
 from othello.internal.board import (
+    Board,
     WHITE,
     BLACK,
     EMPTY,
@@ -23,7 +27,8 @@ class SimpleBoard:
     """
     Minimal board implementation for heuristic tests.
     - Uses a 2D grid of ints (WHITE / BLACK / EMPTY).
-    - legal_moves_map is a dict: color -> list of (r, c) moves.
+    - Exposes `white` / `black` bitboards (bit r*size+c) decoded from the grid, like the real Board.
+    - legal_moves_map is a dict: color -> list of (r, c) moves (also served as a bitboard by legal_moves_mask).
     """
     def __init__(self, size=8, grid=None, legal_moves_map=None, is_end=False):
         self.size = size
@@ -36,12 +41,31 @@ class SimpleBoard:
     def get(self, r, c):
         return self.grid[r][c]
 
+    def _bitboard(self, color):
+        return sum(
+            1 << (r * self.size + c)
+            for r in range(self.size)
+            for c in range(self.size)
+            if self.grid[r][c] == color
+        )
+
+    @property
+    def white(self):
+        return self._bitboard(WHITE)
+
+    @property
+    def black(self):
+        return self._bitboard(BLACK)
+
     def set(self, r, c, value):
         self.grid[r][c] = value
 
     def legal_moves(self, color):
         return self.legal_moves_map.get(color, [])
 
+    def legal_moves_mask(self, color):
+        return sum(1 << (r * self.size + c) for r, c in self.legal_moves(color))
+
     def is_end(self):
         return self._is_end
 
@@ -265,7 +289,7 @@ def test_evaluate_terminal_win_for_black():
 
 # ============================== evaluate (non-terminal weighted sum) ==============================
 
-def test_evaluate_non_terminal_uses_weighted_sum(mocker):
+def test_evaluate_non_terminal_uses_weighted_sum():
     """
     For non-terminal boards, evaluate() should:
     - call game_phase(board) to get phase
@@ -275,25 +299,53 @@ def test_evaluate_non_terminal_uses_weighted_sum(mocker):
     # Dummy board that is not terminal
     board = SimpleBoard(is_end=False)
 
-    # Patch game_phase and get_weights to keep things simple
-    mocker.patch("othello.internal.heuristics.game_phase", return_value="custom")
-    mocker.patch(
-        "othello.internal.heuristics.get_weights",
-        return_value={
-            "disk_difference": 1.0,
-            "mobility": 1.0,
-            "corner_control": 1.0,
-            "x_square_penalty": 1.0,
-            "stable_disks": 0.0,
-        },
-    )
-
-    # Patch individual heuristics to known values
-    mocker.patch("othello.internal.heuristics.disc_difference", return_value=1)
-    mocker.patch("othello.internal.heuristics.mobility", return_value=2)
-    mocker.patch("othello.internal.heuristics.corner_control", return_value=3)
-    mocker.patch("othello.internal.heuristics.x_square", return_value=-1)
-
-    value = evaluate(board, color=WHITE)
+    weights = {
+        "disk_difference": 1.0,
+        "mobility": 1.0,
+        "corner_control": 1.0,
+        "x_square_penalty": 1.0,
+        "stable_disks": 0.0,
+    }
+    # Patch game_phase and get_weights to keep things simple,
+    # and the fused heuristics to known values: (disc_difference, mobility, corner_control, x_square)
+    with patch("othello.internal.heuristics.game_phase", return_value="custom"), \
+         patch("othello.internal.heuristics.get_weights", return_value=weights), \
+         patch("othello.internal.heuristics._features", return_value=(1, 2, 3, -1)):
+        value = evaluate(board, color=WHITE)
     # score = 1*1 + 1*2 + 1*3 + 1*(-1) = 5
-    assert value == 5, "evaluate() should combine heuristics using the weight schedule"
\ No newline at end of file
+    assert value == 5, "evaluate() should combine heuristics using the weight schedule"
+
+
+def test_features_match_individual_heuristics():
+    """_features() should return exactly what the four separate heuristics return."""
+    board = SimpleBoard(legal_moves_map={WHITE: [(2, 3), (3, 2)], BLACK: [(4, 5)]})
+    board.set(0, 0, WHITE)
+    board.set(1, 1, WHITE)   # X-square next to its own corner: no penalty
+    board.set(6, 6, BLACK)   # X-square without its corner: penalized
+    board.set(3, 3, BLACK)
+
+    for color in (WHITE, BLACK):
+        expected = (
+            disc_difference(board, color),
+            mobility(board, color),
+            corner_control(board, color),
+            x_square(board, color),
+        )
+        assert _features(board, color) == expected
+
+
+# ============================== evaluate_batch (NumPy) ==============================
+
+def test_evaluate_batch_matches_evaluate():
+    """evaluate_batch() should give the same score as evaluate() for every board in the batch."""
+    pytest.importorskip("numpy")
+    boards = [Board.initial()]
+    after_d3 = Board.initial()
+    after_d3.apply_move(2, 3, BLACK)
+    boards.append(after_d3)
+    full = Board.from_bitboards((1 << 40) - 1, ((1 << 64) - 1) ^ ((1 << 40) - 1)) # terminal: board full, WHITE ahead 40-24
+    boards.append(full)
+
+    for color in (WHITE, BLACK):
+        scores = evaluate_batch([b.white for b in boards], [b.black for b in boards], color)
+        assert list(scores) == [evaluate(b, color) for b in boards], "evaluate_batch should match evaluate()"
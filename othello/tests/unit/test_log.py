@@ -2,6 +2,7 @@
 
 import sys
 import pytest
+from unittest.mock import patch
 
 from othello.internal.log import (
     DebugLogger,
@@ -64,6 +65,21 @@ def test_write_always_prints_to_stdout(capsys, tmp_path):
     log.stop()
 
 
+
+@pytest.mark.parametrize("isatty, msg, flushed", [
+    (False, "line\n", True),   # piped / redirected: block-buffered, flush every write
+    (True, "line\n", False),   # terminal: line-buffered, the newline already flushes
+    (True, "> ", True),         # terminal prompt without a newline
+])
+def test_write_flushes_stdout_unless_terminal_line(isatty, msg, flushed):
+    """write() should only skip the stdout flush for newline-terminated messages on a terminal."""
+    with patch.object(sys, "stdout") as fake_stdout:
+        fake_stdout.isatty.return_value = isatty
+        DebugLogger().write(msg)
+
+    fake_stdout.write.assert_called_once_with(msg)
+    assert fake_stdout.flush.called is flushed
+
 # ============================== DebugLogger.write (file behavior) ==============================
 
 def test_write_writes_to_file_when_enabled(tmp_path):
@@ -116,26 +132,24 @@ def test_write_does_not_crash_when_disabled(tmp_path, capsys):
 
 # ============================== dprint (integration with LOGGER) ==============================
 
-def test_dprint_calls_logger_write(mocker):
+def test_dprint_calls_logger_write():
     """
     dprint() should format the message and pass it into LOGGER.write().
     """
     # Patch LOGGER.write to inspect what dprint sends
-    mock_write = mocker.patch.object(LOGGER, "write")
-
-    dprint("hello", 123, "world", end="!!\n")
+    with patch.object(LOGGER, "write") as mock_write:
+        dprint("hello", 123, "world", end="!!\n")
 
     # dprint joins args with spaces and adds the 'end' string
     mock_write.assert_called_once_with("hello 123 world!!\n")
 
 
-def test_dprint_uses_newline_by_default(mocker):
+def test_dprint_uses_newline_by_default():
     """
     Default end argument for dprint() should be a newline.
     """
-    mock_write = mocker.patch.object(LOGGER, "write")
-
-    dprint("line")
+    with patch.object(LOGGER, "write") as mock_write:
+        dprint("line")
 
     mock_write.assert_called_once_with("line\n")
 
@@ -158,9 +172,27 @@ def test_dprint_integration_with_real_logger(tmp_path, capsys):
         captured = capsys.readouterr()
         assert "integrated message\n" in captured.out
 
-        # Check file content
+        # Check file content (file writes are buffered until flush() / stop())
+        LOGGER.flush()
         content = log_file.read_text(encoding="utf-8")
         assert "integrated message\n" in content
     finally:
         # Make sure we always clean up the global logger
-        LOGGER.stop()
\ No newline at end of file
+        LOGGER.stop()
+
+
+def test_write_buffers_file_until_flush_every(tmp_path, monkeypatch):
+    """write() should only flush the log file once every FLUSH_EVERY messages."""
+    monkeypatch.setattr("othello.internal.log.FLUSH_EVERY", 3)
+    log = DebugLogger()
+    log_file = tmp_path / "debug.txt"
+    log.start(filename=str(log_file))
+
+    log.write("a\n")
+    log.write("b\n")
+    assert log_file.read_text(encoding="utf-8") == "", "nothing should hit disk before FLUSH_EVERY messages"
+
+    log.write("c\n")
+    assert log_file.read_text(encoding="utf-8") == "a\nb\nc\n"
+
+    log.stop()
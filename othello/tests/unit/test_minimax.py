@@ -1,12 +1,58 @@
 import pytest
+from collections import Counter
+from types import SimpleNamespace
+from unittest.mock import patch
 from othello.internal.minimax import (
     Minimax,
     # other necessary imports later
 )
+from othello.internal.board import Board, BLACK
+from othello.internal.heuristics import evaluate
+
+NEG_INF, POS_INF = float('-inf'), float('inf')
+_CORNERS = frozenset({(0,0), (0,7), (7,0), (7,7)})  # corner squares of the standard 8x8 board
+
+# ============================== evaluate stub ==============================
+# evaluate() is patched once for the whole module: a test gets the stub's MagicMock score unless it
+# sets a return value through `mock_eval`, or asks for `real_evaluate` to search with the real heuristics
+@pytest.fixture(scope="module", autouse=True)
+def _patched_evaluate():
+    with patch("othello.internal.minimax.evaluate") as mock_eval:
+        yield mock_eval
+
+
+@pytest.fixture
+def mock_eval(_patched_evaluate):
+    """The module-wide evaluate() stub, cleared of calls / return values from earlier tests."""
+    _patched_evaluate.reset_mock(return_value=True, side_effect=True)
+    return _patched_evaluate
+
+
+@pytest.fixture
+def real_evaluate(mock_eval):
+    """The module-wide stub routed to the real heuristics, for tests that search real boards."""
+    mock_eval.side_effect = evaluate
+    return mock_eval
+
+# ============================== shared mock board ==============================
+THREE_MOVES = ((0,0), (1,1), (2,2))  # legal moves of the mock board (a tuple: nothing to rebuild per call)
+
+
+@pytest.fixture
+def three_move_board():
+    """Mock board with the 3 legal moves above; `played` records every move made, in order."""
+    played = []
+    return SimpleNamespace(
+        size=8,  # standard board size
+        played=played,
+        legal_moves=lambda color: THREE_MOVES,
+        make_move=lambda r, c, color: played.append((r, c)),  # returns None: nothing to undo
+        unmake_move=lambda token: None,  # No-op
+    )
 
 # ============================== test reset_counters ==============================
-def test_reset_counters():
-    minimax = Minimax()
+def test_reset_counters(minimax_default):
+    minimax = minimax_default
     minimax.nodes_searched = 42
     minimax.move_evals = [((0,0), 10), ((1,1), -5)]
     
@@ -16,142 +62,107 @@ def test_reset_counters():
     assert minimax.move_evals == [], "move_evals should be reset to empty list"
 
 # ============================== test choose_move ==============================
-def test_choose_move_no_legal_moves():
-    minimax = Minimax()
-    
-    class MockBoard:
-        def __init__(self):
-            self.size = 8  # standard board size
-        def legal_moves(self, color):
-            return []  # No legal moves
+def test_choose_move_no_legal_moves(minimax_default):
+    minimax = minimax_default
     
-    board = MockBoard()
+    board = SimpleNamespace(size=8, legal_moves=lambda color: [])  # No legal moves
     move = minimax.choose_move(board, color=1)
     
     assert move is None, "choose_move should return None when there are no legal moves"
 
 # ============================== test choose_move with legal moves (mocked minimax) ==============================
-def test_choose_move_picks_best_move(mocker):
+def test_choose_move_picks_best_move(monkeypatch, minimax_ab, three_move_board):
     """
-    choose_move should call minimax() once per legal move and return the move
-    with the highest evaluation score.
+    choose_move should call minimax() once per legal move (per iterative-deepening pass)
+    and return the move with the highest evaluation score.
     """
-    minimax = Minimax(depth=2, alpha_beta=True, debug=False)
-    
-    # Simple board with 3 legal moves
-    class MockBoard:
-        def __init__(self):
-            self.calls = []
-            self.size = 8  # standard board size
-        
-        def legal_moves(self, color):
-            return [(0,0), (1,1), (2,2)]
-        
-        def copy(self):
-            return self  # Not used deeply in this test
-        
-        def apply_move(self, r, c, color):
-            pass  # No-op
-    
-    board = MockBoard()
-    
-    # Patch minimax.minimax to return predictable scores for each move
-    # Order matches legal_moves above
-    mocker.patch.object(minimax, "minimax", side_effect=[5, 10, -3])
+    minimax = minimax_ab
+    board = three_move_board
+    
+    # Patch minimax.minimax to return a fixed score for each move,
+    # whatever order and depth iterative deepening searches it at
+    scores = {(0,0): 5, (1,1): 10, (2,2): -3}
+    calls = [0]  # plain counter instead of a MagicMock
+    def fake_minimax(self, board, *args, **kwargs):
+        calls[0] += 1
+        return scores[board.played[-1]]  # score of the move just played
+    monkeypatch.setattr(Minimax, "minimax", fake_minimax)  # on the class: Minimax uses __slots__, so instances take no new attributes
     
     best_move = minimax.choose_move(board, color=1)
     
     assert best_move == (1,1), "choose_move should select the move with the highest evaluation"
+    assert calls[0] == 3 * minimax.depth, "every root move should be searched once per depth 1..depth"
     
-    # move_evals should store all move-eval pairs
-    assert minimax.move_evals == [
-        ((0,0), 5),
-        ((1,1), 10),
-        ((2,2), -3),
-    ], "move_evals should record each legal move and its returned minimax value"
+    # move_evals should store all move-eval pairs (from the deepest pass)
+    assert dict(minimax.move_evals) == scores, "move_evals should record each legal move and its returned minimax value"
+    assert minimax.move_evals[0][0] == (1,1), "the best move of the previous pass should be searched first"
 
 # ============================== test minimax base case ==============================
-def test_minimax_base_case_calls_evaluate(mocker):
+def test_minimax_base_case_calls_evaluate(mock_eval, minimax_default):
     """
     If depth == 0 or board.is_end() returns True,
     minimax should immediately call evaluate() and return that value.
     """
-    minimax = Minimax()
+    minimax = minimax_default
     minimax.root_color = 1  # Required for the evaluate(board, root_color) call
     
-    class MockTerminalBoard:
-        def is_end(self):
-            return True  # Force immediate base case
+    board = SimpleNamespace(is_end=lambda: True)  # Force immediate base case
     
-    board = MockTerminalBoard()
-    
-    # Patch evaluate() to return a predictable value
-    mock_eval = mocker.patch(
-        "othello.internal.minimax.evaluate",
-        return_value=123
-    )
+    # Make the evaluate() stub return a predictable value
+    mock_eval.return_value = 123
     
     result = minimax.minimax(
         board=board,
         depth=5,            # depth > 0 shouldn't matter because is_end() stops early
-        alpha=float('-inf'),
-        beta=float('inf'),
+        alpha=NEG_INF,
+        beta=POS_INF,
         maximizing_player=True,
     )
     
     assert result == 123, "minimax should return the evaluate() result during the base case"
     mock_eval.assert_called_once_with(board, minimax.root_color)
 
+def test_minimax_on_fresh_instance_without_choose_move(real_evaluate):
+    """minimax() should work on a real board straight after construction, before any choose_move() call."""
+
+    result = Minimax().minimax(Board.initial(), 2, NEG_INF, POS_INF, True)
+
+    assert isinstance(result, (int, float)), "minimax should return a score"
+
 # ============================== test alpha-beta pruning ==============================
-def test_alpha_beta_pruning_stops_early(mocker):
+def test_alpha_beta_pruning_stops_early(monkeypatch, minimax_ab, three_move_board):
     """
     When alpha >= beta, minimax should prune remaining branches and
     avoid calling minimax() for later moves.
     """
-    minimax = Minimax(depth=3, alpha_beta=True, debug=False)
-
-    # Mock board with 3 legal moves
-    class MockBoard:
-        def legal_moves(self, color):
-            return [(0,0), (1,1), (2,2)]
-        
-        def copy(self):
-            return self
-        
-        def apply_move(self, r, c, color):
-            pass
-        size = 8  # standard board size
-
-    board = MockBoard()
+    minimax = minimax_ab
+    board = three_move_board
 
     # Mock the minimax method to simulate pruning:
-    # - First move returns a HIGH value (forcing alpha to rise)
-    # - Second move returns a value that causes beta <= alpha
-    # - Third move SHOULD NEVER be evaluated (pruned)
-    mock_minimax = mocker.patch.object(
-        minimax,
-        "minimax",
-        side_effect=[float("inf"), 0, 0]  # third call should not happen
-    )
+    # - First move returns a HIGH value (forcing alpha to rise until beta <= alpha)
+    # - The other moves SHOULD NEVER be evaluated (pruned), in any iterative-deepening pass
+    scores = {(0,0): POS_INF, (1,1): 0, (2,2): 0}
+    calls = [0]
+    def fake_minimax(self, board, *args, **kwargs):
+        calls[0] += 1
+        return scores[board.played[-1]]
+    monkeypatch.setattr(Minimax, "minimax", fake_minimax)
 
     # Run choose_move to trigger the minimax loop/pruning
     minimax.choose_move(board, color=1)
 
-    # Should only call minimax twice, NOT three times
-    assert mock_minimax.call_count == 1, ( # call_count is a built-in attribute of mock objects that tracks how many times the mock was called
-        "Alpha-beta pruning should skip evaluating later moves after cutoff. Instead it got {} calls.".format(mock_minimax.call_count)
+    # Should only call minimax once per depth pass (always on the first move), NOT three times
+    assert calls[0] == minimax.depth, (
+        f"Alpha-beta pruning should skip evaluating later moves after cutoff. Instead it got {calls[0]} calls."
     )
+    assert board.played == [(0,0)] * minimax.depth, "Only the first move should ever be searched"
 
 # ============================== test _inorder (move ordering) ==============================
-def test_inorder_prioritizes_corners():
-    minimax = Minimax()
-    
-    # MockBoard only needs a .size attribute for _inorder behavior
-    class MockBoard:
-        def __init__(self):
-            self.size = 8  # Standard Othello board size
+def test_inorder_prioritizes_corners(minimax_default):
+    minimax = minimax_default
     
-    board = MockBoard()
+    # The mock board only needs a .size attribute for _inorder behavior
+    board = SimpleNamespace(size=8)  # Standard Othello board size
     
     # Mix of corner and non-corner moves
     moves = [
@@ -164,8 +175,71 @@ def test_inorder_prioritizes_corners():
     ordered = minimax._inorder(board, color=1, moves=moves)
     
     # The first two should be corners
-    assert ordered[0] in [(0,0), (7,7)]
-    assert ordered[1] in [(0,0), (7,7)]
+    assert ordered[0] in _CORNERS and ordered[1] in _CORNERS
     
     # All moves should still be present (no loss or duplication)
-    assert set(ordered) == set(moves), "All moves must be preserved by _inorder"
\ No newline at end of file
+    assert Counter(ordered) == Counter(moves), "All moves must be preserved by _inorder"
+
+# ============================== test move ordering speeds up alpha-beta ==============================
+def test_move_ordering_reduces_nodes_searched(monkeypatch, real_evaluate):
+    """
+    On a real mid-game position, searching with move ordering (_inorder + _order_moves)
+    should visit fewer nodes than searching the same moves unordered.
+    """
+
+    # deterministic position: 16 plies, each taking a legal move picked by ply number
+    board = Board.initial()
+    color = BLACK
+    for ply in range(16):
+        moves = board.legal_moves(color)
+        board.apply_move(*moves[ply % len(moves)], color)
+        color = -color
+
+    def nodes_searched():
+        minimax = Minimax(depth=4, alpha_beta=True, debug=False)
+        minimax.choose_move(board, color)
+        return minimax.nodes_searched
+
+    ordered_nodes = nodes_searched()
+    monkeypatch.setattr(Minimax, "_inorder", lambda self, board, color, moves: moves)
+    monkeypatch.setattr(Minimax, "_order_moves", lambda self, board, color, moves, flips=None: moves)
+    unordered_nodes = nodes_searched()
+
+    assert ordered_nodes < unordered_nodes, (
+        f"move ordering should prune more: {ordered_nodes} nodes ordered vs {unordered_nodes} unordered"
+    )
+
+# ============================== test transposition table ==============================
+def test_transposition_table_speeds_up_repeated_search(real_evaluate, minimax_default):
+    """
+    The transposition table survives between choose_move() calls, so searching
+    the same position again should touch far fewer nodes and pick the same move.
+    """
+
+    minimax = minimax_default
+    board = Board.initial()
+    board.apply_move(2, 3, BLACK)
+
+    first_move = minimax.choose_move(board, -BLACK)
+    first = minimax.nodes_searched
+    second_move = minimax.choose_move(board, -BLACK)
+
+    assert minimax.nodes_searched < first, "cached positions should not be searched again"
+    assert second_move == first_move
+
+    minimax.clear_tt()
+    minimax.choose_move(board, -BLACK)
+    assert minimax.nodes_searched == first, "clear_tt() should bring back a full search"
+
+# ============================== test killer moves ==============================
+def test_store_killer_keeps_two_latest_and_promotes_them(minimax_default):
+    minimax = minimax_default # killers come freshly reset from the fixture
+
+    minimax._store_killer(2, (0, 0))
+    minimax._store_killer(2, (1, 1))
+    minimax._store_killer(2, (1, 1))  # same move again should not push (0,0) out
+    assert minimax.killers[2] == [(1, 1), (0, 0)], "killers should hold the 2 latest cutoff moves, newest first"
+
+    moves = [(2, 2), (0, 0), (3, 3), (1, 1)]
+    ordered = minimax._promote(moves, (None, *minimax.killers[2]))
+    assert ordered == [(1, 1), (0, 0), (2, 2), (3, 3)], "killer moves should be tried first, rest keep their order"
@@ -1,6 +1,9 @@
 # othello/tests/unit/test_utils.py
 
+import string
+import time
 import pytest
+from hypothesis import given, settings, strategies as st
 from othello.internal.utils import (
     to_algebra,
     from_algebra,
@@ -25,82 +28,59 @@ def test_to_algebra_valid_positions(move, expected):
 
 # ============================= from_algebra Tests =============================
 
-# parametrize test cases for reusable testing
-@pytest.mark.parametrize(
-    "token, expected",
-    [
-        ("a1", (0, 0)),
-        ("H8", (7, 7)),      # uppercase allowed
-        ("C2", (1, 2)),
-    ],
+# data-driven: one test walks these tuples instead of one pytest node per token
+FROM_ALGEBRA_VALID = (
+    ("a1", (0, 0)),
+    ("H8", (7, 7)),      # uppercase allowed
+    ("C2", (1, 2)),
 )
-def test_from_algebra_valid_inputs(token, expected):
-    assert from_algebra(token) == expected
-
-
-@pytest.mark.parametrize(
-    "token",
-    ["z3", "i1", "11", "", None, "a", "a100", "3b"]  # invalid letters, too short/long, non-letter starts
+FROM_ALGEBRA_INVALID = (
+    "z3", "i1", "11", "", None, "a", "a100", "3b",  # invalid letters, too short/long, non-letter starts
+    "a0", "a9", "h0", "h10",                        # row out of range
+    "ab", "a1x", "a1b",                             # non-numeric row part
 )
-def test_from_algebra_invalid_inputs(token):
-    assert from_algebra(token) is None
 
 
-@pytest.mark.parametrize("token", ["a0", "a9", "h0", "h10"])
-def test_from_algebra_out_of_range_rows(token):
-    assert from_algebra(token) is None
+def test_from_algebra_bulk():
+    for token, expected in FROM_ALGEBRA_VALID:
+        assert from_algebra(token) == expected, f"from_algebra({token!r}) should be {expected}"
+    for token in FROM_ALGEBRA_INVALID:
+        assert from_algebra(token) is None, f"from_algebra({token!r}) should be None"
 
 
-@pytest.mark.parametrize("token", ["ab", "a1x", "a1b"])
-def test_from_algebra_non_numeric_row_part(token):
-    assert from_algebra(token) is None
+def test_from_algebra_printable_sweep():
+    """
+    from_algebra over every printable character followed by 0-99 (10^4 tokens): only a-h / A-H with a row
+    of 1-8 is a square. Also a loose time budget, so parsing stays a lookup rather than string surgery.
+    """
+    tokens = [f"{ch}{n}" for ch in string.printable for n in range(100)]
+    start = time.perf_counter()
+    results = [from_algebra(token) for token in tokens]
+    elapsed = time.perf_counter() - start
 
+    for token, result in zip(tokens, results):
+        col_ch, row_part = token[0].lower(), token[1:]
+        valid = col_ch in "abcdefgh" and row_part in {str(n) for n in range(1, BOARD_SIZE + 1)}
+        expected = (int(row_part) - 1, ord(col_ch) - ord("a")) if valid else None
+        assert result == expected, f"from_algebra({token!r}) should be {expected}"
+    assert elapsed < 0.5, f"from_algebra took {elapsed:.3f}s for {len(tokens)} tokens"
 
-def test_from_algebra_to_algebra_round_trip():
-    """Every valid (row, col) should convert to algebra and back."""
-    for row in range(BOARD_SIZE):
-        for col in range(BOARD_SIZE):
-            algebra = to_algebra((row, col))
-            assert from_algebra(algebra) == (row, col)
 
+@settings(max_examples=64)
+@given(row=st.integers(0, BOARD_SIZE - 1), col=st.integers(0, BOARD_SIZE - 1))
+def test_from_algebra_to_algebra_round_trip(row, col):
+    """Every valid (row, col) should convert to algebra and back (property test: a bounded sample of squares, shrunk on failure)."""
+    assert from_algebra(to_algebra((row, col))) == (row, col)
 
-# ============================= in_bounds Tests =============================
-
-@pytest.mark.parametrize(
-    "r, c",
-    [
-        (0, 0),
-        (7, 7),
-        (3, 4),
-        (5, 2),
-    ],
-)
-def test_in_bounds_valid_coordinates(r, c):
-    assert in_bounds(r, c) is True
-
-
-@pytest.mark.parametrize(
-    "r, c",
-    [
-        (-1, 0),
-        (0, -1),
-        (-2, -2),
-    ],
-)
-def test_in_bounds_negative_indices(r, c):
-    assert in_bounds(r, c) is False
 
+# ============================= in_bounds Tests =============================
 
-@pytest.mark.parametrize(
-    "r, c",
-    [
-        (8, 0),
-        (0, 8),
-        (10, 10),
-    ],
-)
-def test_in_bounds_out_of_range(r, c):
-    assert in_bounds(r, c) is False
+def test_in_bounds_sweep():
+    """Every (r, c) from -2 to 10 on both axes: inside exactly when 0 <= r, c < BOARD_SIZE (covers negatives and overflow)."""
+    for r in range(-2, BOARD_SIZE + 3):
+        for c in range(-2, BOARD_SIZE + 3):
+            expected = 0 <= r < BOARD_SIZE and 0 <= c < BOARD_SIZE
+            assert in_bounds(r, c) is expected, f"in_bounds({r}, {c}) should be {expected}"
 
 
 def test_in_bounds_custom_size():
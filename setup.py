@@ -0,0 +1,21 @@
+# setup.py
+
+# Optional ahead-of-time build: compiles othello/internal/board.py into a C extension with mypyc.
+#   pip install mypy
+#   python setup.py build_ext --inplace
+# The compiled board.*.so sits next to board.py and Python imports it instead; delete it to go back to pure Python.
+# Without mypy installed the package installs as plain Python (no extension modules).
+# Only board.py is compiled: tests patch functions in heuristics.py and methods of Minimax, which compiled code would bypass.
+from setuptools import setup
+
+try:
+    from mypyc.build import mypycify
+    ext_modules = mypycify(["othello/internal/board.py"])
+except ImportError: # mypy is optional
+    ext_modules = []
+
+setup(
+    name="othello",
+    packages=["othello", "othello.internal"],
+    ext_modules=ext_modules,
+)